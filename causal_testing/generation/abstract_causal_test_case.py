@@ -42,13 +42,16 @@ class AbstractCausalTestCase:
         :param sample_size: The number of test cases to generate.
         :return: A list of causal test cases and a dataframe representing the required model run configurations.
         """
+        # Collect the scenario inputs once rather than filtering the scenario variables for every sample
+        inputs = list(self.scenario.inputs())
+
         # Generate the Latin Hypercube samples and put into a dataframe
         samples = pd.DataFrame(
-            lhsmdu.sample(len(self.scenario.inputs()), sample_size).T,
-            columns=[v.name for v in self.scenario.inputs()],
+            lhsmdu.sample(len(inputs), sample_size).T,
+            columns=[v.name for v in inputs],
         )
         # Project the samples to the variables' distributions
-        for var in self.scenario.inputs():
+        for var in inputs:
             # TODO: This only works for Inputs. We need to do it for Metas too...
             samples[var.name] = lhsmdu.inverseTransformSample(
                 var.distribution, samples[var.name]
@@ -56,7 +59,7 @@ class AbstractCausalTestCase:
 
         concrete_tests = []
         runs = []
-        run_columns = sorted([v.name for v in self.scenario.inputs()])
+        run_columns = sorted([v.name for v in inputs])
         for _, row in samples.iterrows():
             optimizer = z3.Optimize()
             for i, c in enumerate(self.scenario.constraints):
@@ -64,7 +67,7 @@ class AbstractCausalTestCase:
             for i, c in enumerate(self.intervention_constraints):
                 optimizer.assert_and_track(c, f"intervention_{i}")
 
-            optimizer.add_soft([v.z3 == row[v.name] for v in self.scenario.inputs()])
+            optimizer.add_soft([v.z3 == row[v.name] for v in inputs])
             sat = optimizer.check()
             if sat == z3.unsat:
                 logger.warning(
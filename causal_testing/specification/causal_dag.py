@@ -84,6 +84,29 @@ def list_all_min_sep(graph: nx.Graph, treatment_node: Node, outcome_node: Node,
             yield treatment_node_set_neighbours
 
 
+def _reachable(adjacency, source: Node) -> frozenset:
+    """ Find every node reachable from a source node by a depth-first walk over a directed graph's adjacency.
+
+    The adjacency (e.g. graph._succ for descendants or graph._pred for ancestors) is scanned directly, which avoids
+    the overhead of the view objects returned by successors and predecessors in nx.descendants and nx.ancestors.
+
+    :param adjacency: A mapping from each node to a mapping keyed by its neighbours in the direction of the walk.
+    :param source: The node from which to start the walk.
+    :return: A frozenset of the nodes reachable from source, excluding source itself.
+    """
+    if source not in adjacency:
+        raise nx.NetworkXError(f"The node {source} is not in the graph.")
+    stack = [source]
+    seen = {source}
+    while stack:
+        for neighbour in adjacency[stack.pop()]:
+            if neighbour not in seen:
+                seen.add(neighbour)
+                stack.append(neighbour)
+    seen.remove(source)
+    return frozenset(seen)
+
+
 def close_separator(graph: nx.Graph, treatment_node: Node, outcome_node: Node, treatment_node_set: {Node}) -> {Node}:
     """ Compute the close separator for a set of treatments in an undirected graph.
 
@@ -127,11 +150,11 @@ class CausalDAG(nx.DiGraph):
     """
 
     def __init__(self, dot_path: str = None, **attr):
+        self._ancestors_cache = {}
+        self._descendants_cache = {}
         super().__init__(**attr)
         if dot_path:
-            self.graph = nx.DiGraph(nx.drawing.nx_agraph.read_dot(dot_path))
-        else:
-            self.graph = nx.DiGraph()
+            self.update(nx.nx_pydot.read_dot(dot_path))
 
         if not self.is_acyclic():
             raise nx.HasACycle("Invalid Causal DAG: contains a cycle.")
@@ -139,21 +162,129 @@ class CausalDAG(nx.DiGraph):
     def add_edge(self, u_of_edge: Node, v_of_edge: Node, **attr):
         """ Add an edge to the causal DAG.
 
-        Overrides the default networkx method to prevent users from adding a cycle.
+        Overrides the default networkx method to prevent users from adding a cycle. Rather than rescanning the whole
+        graph, the edge u -> v is rejected before insertion if v can already reach u.
         :param u_of_edge: From node
         :param v_of_edge: To node
         :param attr: Attributes
         """
-        self.graph.add_edge(u_of_edge, v_of_edge, **attr)
+        if u_of_edge == v_of_edge or (
+            u_of_edge in self
+            and v_of_edge in self
+            and nx.has_path(self, v_of_edge, u_of_edge)
+        ):
+            raise nx.HasACycle("Invalid Causal DAG: contains a cycle.")
+        super().add_edge(u_of_edge, v_of_edge, **attr)
+        self._clear_reachability_cache()
+
+    def add_edges_from(self, ebunch_to_add, **attr):
+        """ Add a batch of edges to the causal DAG.
+
+        Overrides the default networkx method to prevent users from adding a cycle. All edges are inserted before a
+        single acyclicity check is performed. If the batch introduces a cycle, the causal DAG is restored to its state
+        before the batch: new edges and nodes are removed and the attributes of existing edges are reverted.
+        :param ebunch_to_add: Container of edges given as (u, v) or (u, v, d) tuples
+        :param attr: Attributes
+        """
+        ebunch_to_add = list(ebunch_to_add)
+        new_nodes = list(dict.fromkeys(node for edge in ebunch_to_add for node in edge[:2] if node not in self))
+        new_edges = []
+        existing_edge_attrs = {}
+        for edge in ebunch_to_add:
+            if self.has_edge(*edge[:2]):
+                existing_edge_attrs.setdefault(edge[:2], dict(self.edges[edge[:2]]))
+            else:
+                new_edges.append(edge[:2])
+        super().add_edges_from(ebunch_to_add, **attr)
+        self._clear_reachability_cache()
         if not self.is_acyclic():
+            self.remove_edges_from(new_edges)
+            self.remove_nodes_from(new_nodes)
+            for edge, edge_attrs in existing_edge_attrs.items():
+                self.edges[edge].clear()
+                self.edges[edge].update(edge_attrs)
             raise nx.HasACycle("Invalid Causal DAG: contains a cycle.")
 
+    def remove_edge(self, u: Node, v: Node):
+        """ Remove an edge from the causal DAG.
+
+        :param u: From node
+        :param v: To node
+        """
+        super().remove_edge(u, v)
+        self._clear_reachability_cache()
+
+    def remove_edges_from(self, ebunch):
+        """ Remove a batch of edges from the causal DAG.
+
+        :param ebunch: Container of edges given as (u, v) or (u, v, d) tuples
+        """
+        super().remove_edges_from(ebunch)
+        self._clear_reachability_cache()
+
+    def remove_node(self, n: Node):
+        """ Remove a node and its edges from the causal DAG.
+
+        :param n: The node to remove
+        """
+        super().remove_node(n)
+        self._clear_reachability_cache()
+
+    def remove_nodes_from(self, nodes):
+        """ Remove a batch of nodes and their edges from the causal DAG.
+
+        :param nodes: Container of nodes
+        """
+        super().remove_nodes_from(nodes)
+        self._clear_reachability_cache()
+
+    def clear(self):
+        """ Remove all nodes, edges, and graph attributes from the causal DAG. """
+        super().clear()
+        self._clear_reachability_cache()
+
+    def clear_edges(self):
+        """ Remove all edges from the causal DAG but keep its nodes. """
+        super().clear_edges()
+        self._clear_reachability_cache()
+
+    def _clear_reachability_cache(self):
+        """Invalidate the memoised ancestor and descendant sets after the structure of the graph has changed."""
+        self._ancestors_cache.clear()
+        self._descendants_cache.clear()
+
+    def _ancestors(self, node: Node) -> frozenset:
+        """Get the ancestors of a node, memoised until the structure of the graph changes. Read-only views (e.g. the
+        back-door graphs) reflect changes to the graph they were taken from, so their results are not memoised.
+
+        :param node: A node in the causal DAG.
+        :return: A frozenset of the ancestors of the node, excluding the node itself.
+        """
+        if nx.is_frozen(self):
+            return _reachable(self._pred, node)
+        if node not in self._ancestors_cache:
+            self._ancestors_cache[node] = _reachable(self._pred, node)
+        return self._ancestors_cache[node]
+
+    def _descendants(self, node: Node) -> frozenset:
+        """Get the descendants of a node, memoised until the structure of the graph changes. As with _ancestors, results
+        for read-only views are not memoised.
+
+        :param node: A node in the causal DAG.
+        :return: A frozenset of the descendants of the node, excluding the node itself.
+        """
+        if nx.is_frozen(self):
+            return _reachable(self._succ, node)
+        if node not in self._descendants_cache:
+            self._descendants_cache[node] = _reachable(self._succ, node)
+        return self._descendants_cache[node]
+
     def is_acyclic(self) -> bool:
         """Checks if the graph is acyclic.
 
         :return: True if acyclic, False otherwise.
         """
-        return not list(nx.simple_cycles(self.graph))
+        return nx.is_directed_acyclic_graph(self)
 
     def get_proper_backdoor_graph(self, treatments: [str], outcomes: [str]) -> "CausalDAG":
         """ Convert the causal DAG to a proper back-door graph.
@@ -167,23 +298,19 @@ class CausalDAG(nx.DiGraph):
 
         :param treatments: A list of treatment variables.
         :param outcomes: A list of outcomes.
-        :return: A CausalDAG corresponding to the proper back-door graph.
+        :return: A read-only view of the CausalDAG corresponding to the proper back-door graph.
         """
-        for var in treatments + outcomes:
-            if var not in self.graph.nodes:
-                raise IndexError(f"{var} not a node in Causal DAG.\nValid nodes are{self.graph.nodes}.")
+        missing_variables = [var for var in (*treatments, *outcomes) if var not in self]
+        if missing_variables:
+            raise IndexError(f"{missing_variables} not nodes in Causal DAG.\nValid nodes are {self.nodes}.")
 
-        proper_backdoor_graph = self.copy()
-        nodes_on_proper_causal_path = proper_backdoor_graph.proper_causal_pathway(
-            treatments, outcomes
-        )
+        nodes_on_proper_causal_path = self.proper_causal_pathway(treatments, outcomes)
         edges_to_remove = [
             (u, v)
-            for (u, v) in proper_backdoor_graph.graph.out_edges(treatments)
+            for (u, v) in self.out_edges(treatments)
             if v in nodes_on_proper_causal_path
         ]
-        proper_backdoor_graph.graph.remove_edges_from(edges_to_remove)
-        return proper_backdoor_graph
+        return nx.restricted_view(self, nodes=[], edges=edges_to_remove)
 
     def get_ancestor_graph(self, treatments: [str], outcomes: [str]) -> "CausalDAG":
         """ Given a list of treament variables and a list of outcome variables, transform a CausalDAG into an ancestor
@@ -200,21 +327,11 @@ class CausalDAG(nx.DiGraph):
         :return: An ancestral graph relative to the set of variables X union Y.
         """
         ancestor_graph = self.copy()
-        treatment_ancestors = set.union(
-            *[
-                nx.ancestors(ancestor_graph.graph, treatment).union({treatment})
-                for treatment in treatments
-            ]
-        )
-        outcome_ancestors = set.union(
-            *[
-                nx.ancestors(ancestor_graph.graph, outcome).union({outcome})
-                for outcome in outcomes
-            ]
-        )
+        treatment_ancestors = set().union(*map(self._ancestors, treatments)).union(treatments)
+        outcome_ancestors = set().union(*map(self._ancestors, outcomes)).union(outcomes)
         variables_to_keep = treatment_ancestors.union(outcome_ancestors)
-        variables_to_remove = set(self.graph.nodes).difference(variables_to_keep)
-        ancestor_graph.graph.remove_nodes_from(variables_to_remove)
+        variables_to_remove = set(self.nodes).difference(variables_to_keep)
+        ancestor_graph.remove_nodes_from(variables_to_remove)
         return ancestor_graph
 
     def enumerate_minimal_adjustment_sets(self, treatments: [str], outcomes: [str]) -> [{str}]:
@@ -243,7 +360,7 @@ class CausalDAG(nx.DiGraph):
             treatments, outcomes
         )
         moralised_proper_backdoor_graph = nx.moral_graph(
-            ancestor_proper_backdoor_graph.graph
+            ancestor_proper_backdoor_graph
         )
 
         # 2. Add an edge X^m to treatment nodes and Y^m to outcome nodes
@@ -349,18 +466,12 @@ class CausalDAG(nx.DiGraph):
         """
         # Condition (1)
         proper_causal_path_vars = self.proper_causal_pathway(treatments, outcomes)
-        descendents_of_proper_casual_paths = set.union(
-            *[
-                set.union(
-                    nx.descendants(self.graph, proper_causal_path_var),
-                    {proper_causal_path_var},
-                )
-                for proper_causal_path_var in proper_causal_path_vars
-            ]
-        )
+        descendents_of_proper_casual_paths = set().union(
+            *map(self._descendants, proper_causal_path_vars)
+        ).union(proper_causal_path_vars)
 
         if not set(covariates).issubset(
-            set(self.graph.nodes).difference(descendents_of_proper_casual_paths)
+            set(self.nodes).difference(descendents_of_proper_casual_paths)
         ):
             logger.info(
                 f"Failed Condition 1: Z={covariates} **is** a descendent of some variable on a proper causal "
@@ -370,7 +481,7 @@ class CausalDAG(nx.DiGraph):
 
         # Condition (2)
         if not nx.d_separated(
-            proper_backdoor_graph.graph, set(treatments), set(outcomes), set(covariates)
+            proper_backdoor_graph, set(treatments), set(outcomes), set(covariates)
         ):
             logger.info(
                 f"Failed Condition 2: Z={covariates} **does not** d-separate X={treatments} and Y={outcomes} in"
@@ -392,22 +503,12 @@ class CausalDAG(nx.DiGraph):
         :return vars_on_proper_causal_pathway: Return a list of the variables on the proper causal pathway between
         treatments and outcomes.
         """
-        treatments_descendants = set.union(
-            *[
-                nx.descendants(self.graph, treatment).union({treatment})
-                for treatment in treatments
-            ]
-        )
+        treatments_descendants = set().union(*map(self._descendants, treatments)).union(treatments)
         treatments_descendants_without_treatments = set(
             treatments_descendants
         ).difference(treatments)
         backdoor_graph = self.get_backdoor_graph(set(treatments))
-        outcome_ancestors = set.union(
-            *[
-                nx.ancestors(backdoor_graph, outcome).union({outcome})
-                for outcome in outcomes
-            ]
-        )
+        outcome_ancestors = set().union(*map(backdoor_graph._ancestors, outcomes)).union(outcomes)
         nodes_on_proper_causal_paths = treatments_descendants_without_treatments.intersection(
             outcome_ancestors
         )
@@ -418,12 +519,9 @@ class CausalDAG(nx.DiGraph):
         treatment nodes are deleted.
 
         :param treatments: The set of treatments whose outgoing edges will be deleted.
-        :return: A back-door graph corresponding to the given causal DAG and set of treatments.
+        :return: A read-only view of the back-door graph corresponding to the given causal DAG and set of treatments.
         """
-        outgoing_edges = self.graph.out_edges(treatments)
-        backdoor_graph = self.graph.copy()
-        backdoor_graph.remove_edges_from(outgoing_edges)
-        return backdoor_graph
+        return nx.restricted_view(self, nodes=[], edges=list(self.out_edges(treatments)))
 
     def depends_on_outputs(self, node: Node, scenario: Scenario) -> bool:
         """Check whether a given node in a given scenario is or depends on a
@@ -442,9 +540,9 @@ class CausalDAG(nx.DiGraph):
         return any(
             [
                 self.depends_on_outputs(n, scenario)
-                for n in self.graph.predecessors(node)
+                for n in self.predecessors(node)
             ]
         )
 
     def __str__(self):
-        return f"Nodes: {self.graph.nodes}\nEdges: {self.graph.edges}"
+        return f"Nodes: {self.nodes}\nEdges: {self.edges}"
@@ -1,8 +1,8 @@
 from abc import ABC, abstractmethod
-from statsmodels.regression.linear_model import RegressionResultsWrapper
+from types import SimpleNamespace
 from econml.dml import CausalForestDML
+from scipy import linalg, stats
 from sklearn.ensemble import GradientBoostingRegressor
-import statsmodels.api as sm
 import pandas as pd
 import numpy as np
 
@@ -60,20 +60,62 @@ class Estimator(ABC):
         """
         pass
 
+    # The columns used by the estimator are derived from the current treatment, adjustment set, outcome, and effect
+    # modifiers on every access, so that changes to these attributes are never ignored. The adjustment set and effect
+    # modifiers are sets, so they are sorted to give the same column order on every access.
+
+    @property
+    def _treatment_cols(self) -> tuple:
+        return tuple(self.treatment)
+
+    @property
+    def _adj_cols(self) -> tuple:
+        return tuple(sorted(self.adjustment_set, key=str))
+
+    @property
+    def _outcome_cols(self) -> tuple:
+        return tuple(self.outcome)
+
+    @property
+    def _necessary_cols(self) -> tuple:
+        return self._treatment_cols + self._adj_cols + self._outcome_cols
+
+    @property
+    def _effect_modifier_cols(self) -> tuple:
+        return tuple(sorted(self.effect_modifiers, key=str)) if self.effect_modifiers else ()
+
 
 class LinearRegressionEstimator(Estimator):
     """ A Linear Regression Estimator is a parametric estimator which restricts the variables in the data to a linear
     combination of parameters and functions of the variables (note these functions need not be linear).
+
+    The model is fit in double precision by default. Passing dtype='float32' builds and solves the design matrix in
+    single precision, which halves its size (and so the peak memory of fitting to large dataframes) at the cost of
+    precision. The covariance of the parameters is still accumulated in double precision, and the reduced precision is
+    recorded as a modelling assumption.
     """
 
+    _WIDENING_BLOCK_ROWS = 2**16  # Rows of a single precision design matrix widened to double precision at a time
+
+    def __init__(self, treatment: tuple, treatment_values: float, control_values: float, adjustment_set: set,
+                 outcome: tuple, df: pd.DataFrame = None, effect_modifiers: set = None, dtype: str = 'float64'):
+        super().__init__(treatment, treatment_values, control_values, adjustment_set, outcome, df, effect_modifiers)
+        self.dtype = np.dtype(dtype)
+        if self.dtype not in (np.float32, np.float64):
+            raise ValueError(f"Linear regression must be fit in float32 or float64, not {self.dtype}.")
+        if self.dtype == np.float32:
+            self.modelling_assumptions.append('The data can be represented in single precision: estimates are only '
+                                              'accurate to a relative tolerance of around 1e-4, and less accurate '
+                                              'still if the design matrix is ill-conditioned.')
+
     def add_modelling_assumptions(self):
         """
         Add modelling assumptions to the estimator. This is a list of strings which list the modelling assumptions that
         must hold if the resulting causal inference is to be considered valid.
         """
-        self.modelling_assumptions += 'The variables in the data must fit a shape which can be expressed as a linear'\
-                                      'combination of parameters and functions of variables. Note that these functions'\
-                                      'do not need to be linear.'
+        self.modelling_assumptions.append('The variables in the data must fit a shape which can be expressed as a '
+                                          'linear combination of parameters and functions of variables. Note that '
+                                          'these functions do not need to be linear.')
 
     def add_squared_term_to_df(self, term_to_square: str):
         """ Add a squared term to the linear regression model and df.
@@ -83,11 +125,7 @@ class LinearRegressionEstimator(Estimator):
 
         :param term_to_square: The term (column in data and variable in DAG) which is to be squared.
         """
-        new_term = str(term_to_square) + '^2'
-        self.df[new_term] = self.df[term_to_square]**2
-        self.adjustment_set.add(new_term)
-        self.modelling_assumptions += f'Relationship between {self.treatment} and {self.outcome} varies quadratically'\
-                                      f'with {term_to_square}.'
+        self.add_feature_terms(squared=[term_to_square])
 
     def add_product_term_to_df(self, term_a: str, term_b: str):
         """ Add a product term to the linear regression model and df.
@@ -99,10 +137,31 @@ class LinearRegressionEstimator(Estimator):
         :param term_a: The first term of the product term.
         :param term_b: The second term of the product term.
         """
-        new_term = str(term_a) + '*' + str(term_b)
-        self.df[new_term] = self.df[term_a] * self.df[term_b]
-        self.adjustment_set.add(new_term)
-        self.modelling_assumptions += f'{term_a} and {term_b} vary linearly with each other.'
+        self.add_feature_terms(products=[(term_a, term_b)])
+
+    def add_feature_terms(self, squared: [str] = (), products: [(str, str)] = ()):
+        """ Add a batch of squared and product terms to the linear regression model and df.
+
+        This is equivalent to calling add_squared_term_to_df for each term in squared and add_product_term_to_df for
+        each pair in products. Terms are computed from the columns already in the df, so a product may not refer to a
+        squared term in the same batch.
+
+        :param squared: The terms (columns in data and variables in DAG) which are to be squared.
+        :param products: The pairs of terms (columns in data and variables in DAG) which are to be multiplied.
+        """
+        new_terms = {}
+        for term_to_square in squared:
+            new_terms[str(term_to_square) + '^2'] = self.df[term_to_square].to_numpy()**2
+            self.modelling_assumptions.append(f'Relationship between {self.treatment} and {self.outcome} varies '
+                                              f'quadratically with {term_to_square}.')
+        for term_a, term_b in products:
+            new_terms[str(term_a) + '*' + str(term_b)] = self.df[term_a].to_numpy() * self.df[term_b].to_numpy()
+            self.modelling_assumptions.append(f'{term_a} and {term_b} vary linearly with each other.')
+
+        # Update the df in place (rather than replacing it) so that the caller's dataframe also gains the new terms
+        for term, values in new_terms.items():
+            self.df[term] = values
+        self.adjustment_set.update(new_terms)
 
     def estimate_unit_ate(self) -> float:
         """ Estimate the unit average treatment effect of the treatment on the outcome. That is, the change in outcome
@@ -111,7 +170,8 @@ class LinearRegressionEstimator(Estimator):
         :return: The unit average treatment effect and the 95% Wald confidence intervals.
         """
         model = self._run_linear_regression()
-        unit_effect = model.params[list(self.treatment)].values[0]  # Unit effect is the coefficient of the treatment
+        treatment_idx = self._param_index.index(self._treatment_cols[0])
+        unit_effect = model.params.iloc[treatment_idx]  # Unit effect is the coefficient of the treatment
         [ci_low, ci_high] = self._get_confidence_intervals(model)
         return unit_effect*self.treatment_values - unit_effect*self.control_values, [ci_low, ci_high]
 
@@ -123,42 +183,86 @@ class LinearRegressionEstimator(Estimator):
         """
         model = self._run_linear_regression()
 
-        # Create an empty individual for the control and treated
-        individuals = pd.DataFrame(0, index=['control', 'treated'], columns=model.params.index)
-        individuals.loc['control', list(self.treatment)] = self.control_values
-        individuals.loc['treated', list(self.treatment)] = self.treatment_values
+        # The predicted outcomes of a treated and a control individual differ only in the treatment parameters
+        contrast = np.zeros(len(self._param_index))
+        treatment_idx = [self._param_index.index(col) for col in self._treatment_cols]
+        contrast[treatment_idx] = np.asarray(self.treatment_values) - np.asarray(self.control_values)
 
         # Perform a t-test to compare the predicted outcome of the control and treated individual (ATE)
-        t_test_results = model.t_test(individuals.loc['treated'] - individuals.loc['control'])
-        ate = t_test_results.effect[0]
-        confidence_intervals = list(t_test_results.conf_int().flatten())
-        return ate, confidence_intervals
+        return self._t_test(model, contrast)
 
-    def _run_linear_regression(self) -> RegressionResultsWrapper:
+    def _run_linear_regression(self) -> SimpleNamespace:
         """ Run linear regression of the treatment and adjustment set against the outcome and return the model.
 
-        :return: The model after fitting to data.
-        """
-        # 1. Reduce dataframe to contain only the necessary columns
-        reduced_df = self.df.copy()
-        necessary_cols = list(self.treatment) + list(self.adjustment_set) + list(self.outcome)
-        missing_rows = reduced_df[necessary_cols].isnull().any(axis=1)
-        reduced_df = reduced_df[~missing_rows]
-
-        # 2. Add intercept
-        reduced_df['Intercept'] = 1
+        The ordinary least squares fit is solved directly with LAPACK, since only the parameters and their covariance
+        are needed for the estimates and confidence intervals.
 
-        # 3. Estimate the unit difference in outcome caused by unit difference in treatment
-        treatment_and_adjustments_cols = reduced_df[list(self.treatment) + list(self.adjustment_set) + ['Intercept']]
-        outcome_col = reduced_df[list(self.outcome)]
-        regression = sm.OLS(outcome_col, treatment_and_adjustments_cols)
-        model = regression.fit()
-        return model
+        :return: The model after fitting to data: its params (indexed by column name), the covariance matrix of the
+        params (cov), and the residual degrees of freedom (df_resid).
+        """
+        # 1. Find the complete rows, i.e. those with a value for every necessary column
+        complete_rows = np.ones(len(self.df), dtype=bool)
+        for col in self._necessary_cols:
+            complete_rows &= self.df[col].notna().to_numpy()
+        all_rows_complete = complete_rows.all()
+
+        # 2. Build a single design matrix with an intercept column, in the column-major layout used by LAPACK. Each
+        # column is copied from the df straight into the matrix in its precision, so that no full-precision copy of the
+        # necessary columns is made.
+        self._param_index = list(self._treatment_cols + self._adj_cols) + ['Intercept']
+        exog = np.ones((np.count_nonzero(complete_rows), len(self._param_index)), dtype=self.dtype, order='F')
+        endog = np.empty(len(exog), dtype=self.dtype)
+        for col_idx, col in enumerate(self._param_index[:-1] + [self._outcome_cols[0]]):
+            col_values = self.df[col].to_numpy()
+            if not all_rows_complete:
+                col_values = col_values[complete_rows]
+            if col_idx < exog.shape[1] - 1:
+                exog[:, col_idx] = col_values
+            else:
+                endog[:] = col_values
+
+        # 3. Estimate the unit difference in outcome caused by unit difference in treatment (gelsd solves in the
+        # precision of the design matrix)
+        params, _, rank, _ = linalg.lstsq(exog, endog, lapack_driver='gelsd')
+        residuals = endog - exog @ params
+        df_resid = len(endog) - rank
+
+        # 4. Compute the sums of squares in double precision, since squaring the design matrix also squares its
+        # condition number. A single precision design matrix is widened one block of rows at a time.
+        if self.dtype == np.float64:
+            residual_sum_of_squares = residuals @ residuals
+            gram = exog.T @ exog
+        else:
+            residual_sum_of_squares = 0.0
+            gram = np.zeros((exog.shape[1], exog.shape[1]))
+            for start in range(0, len(exog), self._WIDENING_BLOCK_ROWS):
+                rows = slice(start, start + self._WIDENING_BLOCK_ROWS)
+                exog_block = exog[rows].astype(np.float64)
+                residuals_block = residuals[rows].astype(np.float64)
+                gram += exog_block.T @ exog_block
+                residual_sum_of_squares += residuals_block @ residuals_block
+        cov = (residual_sum_of_squares / df_resid) * np.linalg.pinv(gram)
+        return SimpleNamespace(params=pd.Series(params, index=self._param_index, dtype=np.float64), cov=cov,
+                               df_resid=df_resid)
 
     def _get_confidence_intervals(self, model):
-        confidence_intervals = model.conf_int(alpha=0.05, cols=None)
-        ci_low, ci_high = confidence_intervals[0][list(self.treatment)], confidence_intervals[1][list(self.treatment)]
-        return [ci_low.values[0], ci_high.values[0]]
+        contrast = np.zeros(len(self._param_index))
+        contrast[self._param_index.index(self._treatment_cols[0])] = 1
+        _, confidence_intervals = self._t_test(model, contrast)
+        return confidence_intervals
+
+    @staticmethod
+    def _t_test(model: SimpleNamespace, contrast: np.ndarray) -> (float, [float, float]):
+        """ Estimate a linear combination of the model parameters and its 95% confidence intervals.
+
+        :param model: A model returned by _run_linear_regression.
+        :param contrast: The weight of each model parameter in the linear combination.
+        :return: The estimate and its 95% confidence intervals.
+        """
+        effect = contrast @ model.params.to_numpy()
+        standard_error = np.sqrt(contrast @ model.cov @ contrast)
+        critical_value = stats.t.ppf(0.975, model.df_resid)
+        return effect, [effect - critical_value * standard_error, effect + critical_value * standard_error]
 
 
 class CausalForestEstimator(Estimator):
@@ -168,38 +272,21 @@ class CausalForestEstimator(Estimator):
     population average.
     """
 
+    _fit_cache = None  # (df, variables, (model, effect_modifier_df)) of the most recent fit
+
     def add_modelling_assumptions(self):
         """ Add any modelling assumptions to the estimator.
 
         :return self: Update self.modelling_assumptions
         """
-        self.modelling_assumptions += 'Non-parametric estimator: no restrictions imposed on the data.'
+        self.modelling_assumptions.append('Non-parametric estimator: no restrictions imposed on the data.')
 
     def estimate_ate(self) -> float:
         """ Estimate the average treatment effect.
 
         :return ate, confidence_intervals: The average treatment effect and 95% confidence intervals.
         """
-        # Remove any NA containing rows
-        reduced_df = self.df.copy()
-        necessary_cols = list(self.treatment) + list(self.adjustment_set) + list(self.outcome)
-        missing_rows = reduced_df[necessary_cols].isnull().any(axis=1)
-        reduced_df = reduced_df[~missing_rows]
-
-        # Split data into effect modifiers (X), confounders (W), treatments (T), and outcome (Y)
-        if self.effect_modifiers:
-            effect_modifier_df = reduced_df[list(self.effect_modifiers)]
-        else:
-            effect_modifier_df = reduced_df[list(self.adjustment_set)]
-        confounders_df = reduced_df[list(self.adjustment_set)]
-        treatment_df = np.ravel(reduced_df[list(self.treatment)])
-        outcome_df = np.ravel(reduced_df[list(self.outcome)])
-
-        # Fit the model to the data using a gradient boosting regressor for both the treatment and outcome model
-        model = CausalForestDML(model_y=GradientBoostingRegressor(),
-                                model_t=GradientBoostingRegressor(),
-                                )
-        model.fit(outcome_df, treatment_df, X=effect_modifier_df, W=confounders_df)
+        model, effect_modifier_df = self._fit_model()
 
         # Obtain the ATE and 95% confidence intervals
         ate = model.ate(effect_modifier_df, T0=self.control_values, T1=self.treatment_values)
@@ -217,37 +304,73 @@ class CausalForestEstimator(Estimator):
         :return results_df: A dataframe containing a conditional average treatment effect, 95% confidence intervals, and
         the covariate (effect modifier) values for each sample.
         """
-
-        # Remove any NA containing rows
-        reduced_df = self.df.copy()
-        necessary_cols = list(self.treatment) + list(self.adjustment_set) + list(self.outcome)
-        missing_rows = reduced_df[necessary_cols].isnull().any(axis=1)
-        reduced_df = reduced_df[~missing_rows]
-
-        # Split data into effect modifiers (X), confounders (W), treatments (T), and outcome (Y)
-        if self.effect_modifiers:
-            effect_modifier_df = reduced_df[list(self.effect_modifiers)]
-        else:
+        if not self._effect_modifier_cols:
             raise Exception('CATE requires the user to define a set of effect modifiers.')
-        confounders_df = reduced_df[list(self.adjustment_set)]
-        treatment_df = reduced_df[list(self.treatment)]
-        outcome_df = reduced_df[list(self.outcome)]
-
-        # Fit a model to the data
-        model = CausalForestDML(model_y=GradientBoostingRegressor(), model_t=GradientBoostingRegressor())
-        model.fit(outcome_df, treatment_df, X=effect_modifier_df, W=confounders_df)
+        model, effect_modifier_df = self._fit_model()
 
         # Obtain CATES and confidence intervals
         conditional_ates = model.effect(effect_modifier_df, T0=self.control_values, T1=self.treatment_values).flatten()
         [ci_low, ci_high] = model.effect_interval(effect_modifier_df, T0=self.control_values, T1=self.treatment_values,
                                                   alpha=0.05)
 
-        # Merge results into a dataframe (CATE, confidence intervals, and effect modifier values)
-        results_df = pd.DataFrame(columns=['cate', 'ci_low', 'ci_high'])
-        results_df['cate'] = list(conditional_ates)
-        results_df['ci_low'] = list(ci_low.flatten())
-        results_df['ci_high'] = list(ci_high.flatten())
-        effect_modifier_df.reset_index(drop=True, inplace=True)
-        results_df[list(self.effect_modifiers)] = effect_modifier_df
-        results_df.sort_values(by=list(self.effect_modifiers), inplace=True)
+        # Merge results into a dataframe (CATE, confidence intervals, and effect modifier values) sorted by the effect
+        # modifiers. lexsort treats its last key as the primary key, so the effect modifiers are passed in reverse.
+        effect_modifier_values = {col: effect_modifier_df[col].to_numpy() for col in self._effect_modifier_cols}
+        order = np.lexsort(tuple(reversed(effect_modifier_values.values())))
+        results_df = pd.DataFrame({'cate': conditional_ates[order],
+                                   'ci_low': ci_low.flatten()[order],
+                                   'ci_high': ci_high.flatten()[order],
+                                   **{col: values[order] for col, values in effect_modifier_values.items()}},
+                                  index=order)
         return results_df
+
+    def clear_cache(self):
+        """ Discard the fitted causal forest so that the next estimate refits it.
+
+        The fitted forest is reused for as long as the estimator's dataframe and variables are unchanged. Call this
+        method after modifying self.df in place.
+        """
+        self._fit_cache = None
+
+    def _prepare_frame(self) -> pd.DataFrame:
+        """ Select the treatment, adjustment set, outcome, and effect modifier columns of the rows which are not missing
+        a value for the treatment, adjustment set, or outcome.
+
+        :return: A dataframe containing only the necessary columns of complete rows.
+        """
+        necessary_cols = list(self._necessary_cols)
+        selected_cols = list(dict.fromkeys(self._necessary_cols + self._effect_modifier_cols))
+        return self.df.loc[self.df[necessary_cols].notna().all(axis=1), selected_cols]
+
+    def _fit_model(self) -> (CausalForestDML, pd.DataFrame):
+        """ Fit a causal forest to the data, reusing the previously fitted forest if neither the dataframe nor the
+        variables have changed since it was fit.
+
+        :return model, effect_modifier_df: The fitted causal forest and the effect modifier values (X) it was fit to.
+        """
+        cache_key = (self._necessary_cols, self._effect_modifier_cols)
+        if self._fit_cache is not None and self._fit_cache[0] is self.df and self._fit_cache[1] == cache_key:
+            return self._fit_cache[2]
+
+        reduced_df = self._prepare_frame()
+
+        # Split data into effect modifiers (X), confounders (W), treatments (T), and outcome (Y)
+        if self._effect_modifier_cols:
+            effect_modifier_df = reduced_df[list(self._effect_modifier_cols)]
+        else:
+            effect_modifier_df = reduced_df[list(self._adj_cols)]
+        confounders_df = reduced_df[list(self._adj_cols)]
+        if len(self._treatment_cols) == 1:
+            treatment_df = reduced_df[self._treatment_cols[0]].to_numpy(copy=False)
+        else:
+            treatment_df = reduced_df[list(self._treatment_cols)].to_numpy(copy=False)
+        outcome_df = reduced_df[self._outcome_cols[0]].to_numpy(copy=False)
+
+        # Fit the model to the data using a gradient boosting regressor for both the treatment and outcome model
+        model = CausalForestDML(model_y=GradientBoostingRegressor(),
+                                model_t=GradientBoostingRegressor(),
+                                )
+        model.fit(outcome_df, treatment_df, X=effect_modifier_df, W=confounders_df)
+
+        self._fit_cache = (self.df, cache_key, (model, effect_modifier_df))
+        return model, effect_modifier_df
@@ -5,12 +5,11 @@ requirements = [
     "pandas~=1.3.4",
     "setuptools~=58.5.3",
     "networkx~=2.6.3",
-    "pygraphviz~=1.7",
+    "pydot~=2.0",
     "pytest~=6.2.5",
     "scikit-learn~=1.0.1",
     "matplotlib~=3.5.0",
     "econml~=0.12.0",
-    "statsmodels~=0.13.1",
     "z3-solver~=4.8.13.0",
     "lhsmdu",
     "tabulate",
@@ -19,8 +19,8 @@ class TestAbstractTestCase(unittest.TestCase):
         self.observational_df_path = os.path.join(temp_dir_path, "observational_data.csv")
         # Y = 3*X1 + X2*X3 + 10
         self.observational_df = pd.DataFrame({"X1": [1, 2, 3, 4], "X2": [5, 6, 7, 8], "X3": [10, 20, 30, 40]})
-        self.observational_df["Y"] = self.observational_df.apply(lambda row: (3 * row.X1) + (row.X2 * row.X3) + 10,
-                                                                 axis=1)
+        self.observational_df["Y"] = (3 * self.observational_df["X1"]) + \
+            (self.observational_df["X2"] * self.observational_df["X3"]) + 10
         self.observational_df.to_csv(self.observational_df_path)
         self.X1 = Input("X1", int, uniform(1, 4))
         self.X2 = Input("X2", int, rv_discrete(values=([7], [1])))
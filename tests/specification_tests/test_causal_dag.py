@@ -26,8 +26,8 @@ class TestCausalDAG(unittest.TestCase):
         """Test whether the Causal DAG is valid."""
         causal_dag = CausalDAG(self.dag_dot_path)
         print(causal_dag)
-        assert list(causal_dag.graph.nodes) == ["A", "B", "C", "D"] and list(
-            causal_dag.graph.edges
+        assert list(causal_dag.nodes) == ["A", "B", "C", "D"] and list(
+            causal_dag.edges
         ) == [("A", "B"), ("B", "C"), ("D", "A"), ("D", "C")]
 
     def test_invalid_causal_dag(self):
@@ -35,10 +35,31 @@ class TestCausalDAG(unittest.TestCase):
         causal_dag = CausalDAG(self.dag_dot_path)
         self.assertRaises(nx.HasACycle, causal_dag.add_edge, "C", "A")
 
+    def test_invalid_causal_dag_self_loop(self):
+        """Test whether a self-loop is rejected as a cycle."""
+        causal_dag = CausalDAG(self.dag_dot_path)
+        self.assertRaises(nx.HasACycle, causal_dag.add_edge, "A", "A")
+
+    def test_add_edges_from_causal_dag(self):
+        """Test whether a batch of edges that does not introduce a cycle is added to the Causal DAG."""
+        causal_dag = CausalDAG(self.dag_dot_path)
+        causal_dag.add_edges_from([("C", "E"), ("D", "E")])
+        assert ("C", "E") in causal_dag.edges and ("D", "E") in causal_dag.edges
+
+    def test_add_edges_from_invalid_causal_dag(self):
+        """Test whether a batch of edges introducing a cycle is rejected and leaves the Causal DAG unchanged."""
+        causal_dag = CausalDAG(self.dag_dot_path)
+        causal_dag.edges["A", "B"]["weight"] = 1
+        nodes = list(causal_dag.nodes)
+        edges = list(causal_dag.edges(data=True))
+        self.assertRaises(nx.HasACycle, causal_dag.add_edges_from, [("A", "B", {"weight": 2}), ("C", "E"), ("E", "A")])
+        assert list(causal_dag.nodes) == nodes
+        assert list(causal_dag.edges(data=True)) == edges
+
     def test_empty_casual_dag(self):
         """Test whether an empty dag can be created."""
         causal_dag = CausalDAG()
-        assert list(causal_dag.graph.nodes) == [] and list(causal_dag.graph.edges) == []
+        assert list(causal_dag.nodes) == [] and list(causal_dag.edges) == []
 
     def tearDown(self) -> None:
         remove_temp_dir_if_existent()
@@ -86,19 +107,50 @@ class TestDAGIdentification(unittest.TestCase):
             ["X1", "X2"], ["Y"]
         )
         self.assertEqual(
-            list(proper_backdoor_graph.graph.edges),
+            list(proper_backdoor_graph.edges),
             [
                 ("X1", "X2"),
                 ("X2", "V"),
                 ("X2", "D2"),
-                ("D1", "D2"),
                 ("D1", "Y"),
+                ("D1", "D2"),
                 ("Y", "D3"),
                 ("Z", "X2"),
                 ("Z", "Y"),
             ],
         )
 
+    def test_proper_backdoor_graph_leaves_causal_dag_unchanged(self):
+        """Test whether the proper back-door graph is a read-only view which does not modify the original Causal DAG."""
+        causal_dag = CausalDAG(self.dag_dot_path)
+        edges = list(causal_dag.edges)
+        proper_backdoor_graph = causal_dag.get_proper_backdoor_graph(["X1", "X2"], ["Y"])
+        self.assertTrue(nx.is_frozen(proper_backdoor_graph))
+        self.assertNotIn(("X2", "D1"), proper_backdoor_graph.edges)
+        self.assertEqual(list(causal_dag.edges), edges)
+
+    def test_proper_backdoor_graph_missing_variables(self):
+        """Test whether every treatment and outcome missing from the Causal DAG is reported in a single error."""
+        causal_dag = CausalDAG(self.dag_dot_path)
+        with self.assertRaises(IndexError) as context:
+            causal_dag.get_proper_backdoor_graph(["X1", "A"], ["B"])
+        self.assertIn("['A', 'B']", str(context.exception))
+
+    def test_proper_causal_pathway_missing_node(self):
+        """Test whether asking for the proper causal pathway of a node missing from the Causal DAG raises an error."""
+        causal_dag = CausalDAG(self.dag_dot_path)
+        self.assertRaises(nx.NetworkXError, causal_dag.proper_causal_pathway, ["ZZ"], ["Y"])
+
+    def test_proper_causal_pathway_after_modification(self):
+        """Test whether the proper causal pathway reflects edges added and removed after it was first computed."""
+        causal_dag = CausalDAG(self.dag_dot_path)
+        xs, ys = ["X1", "X2"], ["Y"]
+        self.assertEqual(causal_dag.proper_causal_pathway(xs, ys), {"D1", "Y"})
+        causal_dag.add_edge("V", "Y")
+        self.assertEqual(causal_dag.proper_causal_pathway(xs, ys), {"D1", "V", "Y"})
+        causal_dag.remove_edge("D1", "Y")
+        self.assertEqual(causal_dag.proper_causal_pathway(xs, ys), {"V", "Y"})
+
     def test_constructive_backdoor_criterion_should_hold(self):
         """Test whether the constructive criterion holds when it should."""
         causal_dag = CausalDAG(self.dag_dot_path)
@@ -160,9 +212,9 @@ class TestDAGIdentification(unittest.TestCase):
         causal_dag = CausalDAG(self.dag_dot_path)
         xs, ys = ["X1", "X2"], ["Y"]
         ancestor_graph = causal_dag.get_ancestor_graph(xs, ys)
-        self.assertEqual(list(ancestor_graph.graph.nodes), ["X1", "X2", "D1", "Y", "Z"])
+        self.assertEqual(list(ancestor_graph.nodes), ["X1", "X2", "D1", "Y", "Z"])
         self.assertEqual(
-            list(ancestor_graph.graph.edges),
+            list(ancestor_graph.edges),
             [("X1", "X2"), ("X2", "D1"), ("D1", "Y"), ("Z", "X2"), ("Z", "Y")],
         )
 
@@ -172,9 +224,9 @@ class TestDAGIdentification(unittest.TestCase):
         xs, ys = ["X1", "X2"], ["Y"]
         proper_backdoor_graph = causal_dag.get_proper_backdoor_graph(xs, ys)
         ancestor_graph = proper_backdoor_graph.get_ancestor_graph(xs, ys)
-        self.assertEqual(list(ancestor_graph.graph.nodes), ["X1", "X2", "D1", "Y", "Z"])
+        self.assertEqual(list(ancestor_graph.nodes), ["X1", "X2", "D1", "Y", "Z"])
         self.assertEqual(
-            list(ancestor_graph.graph.edges),
+            list(ancestor_graph.edges),
             [("X1", "X2"), ("D1", "Y"), ("Z", "X2"), ("Z", "Y")],
         )
 
@@ -188,7 +240,7 @@ class TestDAGIdentification(unittest.TestCase):
     def test_enumerate_minimal_adjustment_sets_multiple(self):
         """Test whether enumerate_minimal_adjustment_sets lists all minimum adjustment sets if multiple are possible."""
         causal_dag = CausalDAG()
-        causal_dag.graph.add_edges_from(
+        causal_dag.add_edges_from(
             [
                 ("X1", "X2"),
                 ("X2", "V"),
@@ -214,7 +266,7 @@ class TestDAGIdentification(unittest.TestCase):
     def test_enumerate_minimal_adjustment_sets_two_adjustments(self):
         """Test whether enumerate_minimal_adjustment_sets lists all possible minimum adjustment sets of arity two."""
         causal_dag = CausalDAG()
-        causal_dag.graph.add_edges_from(
+        causal_dag.add_edges_from(
             [
                 ("X1", "X2"),
                 ("X2", "V"),
@@ -243,7 +295,7 @@ class TestDAGIdentification(unittest.TestCase):
     def test_dag_with_non_character_nodes(self):
         """Test identification for a DAG whose nodes are not just characters (strings of length greater than 1)."""
         causal_dag = CausalDAG()
-        causal_dag.graph.add_edges_from(
+        causal_dag.add_edges_from(
             [
                 ('va', 'ba'),
                 ('ba', 'ia'),
@@ -132,6 +132,63 @@ class TestLinearRegressionEstimator(unittest.TestCase):
         self.assertEqual(round(ate, 1), 3.5)
         self.assertEqual([round(ci_low, 1), round(ci_high, 1)], [2.6, 4.3])
 
+    def test_add_feature_terms(self):
+        """ Test whether adding squared and product terms as a batch gives the same model as adding them one by one. """
+        df = self.chapter_11_df.copy()
+        df['treatments_b'] = df['treatments'] % 7
+        batch_estimator = LinearRegressionEstimator(('treatments',), 100, 90, {'treatments_b'}, ('outcomes',),
+                                                    df.copy())
+        batch_estimator.add_feature_terms(squared=['treatments'], products=[('treatments', 'treatments_b')])
+        single_estimator = LinearRegressionEstimator(('treatments',), 100, 90, {'treatments_b'}, ('outcomes',),
+                                                     df.copy())
+        single_estimator.add_squared_term_to_df('treatments')
+        single_estimator.add_product_term_to_df('treatments', 'treatments_b')
+        self.assertEqual(batch_estimator.adjustment_set, {'treatments_b', 'treatments^2', 'treatments*treatments_b'})
+        self.assertEqual(batch_estimator.modelling_assumptions, single_estimator.modelling_assumptions)
+        self.assertEqual(len(batch_estimator.modelling_assumptions), 2)
+        pd.testing.assert_frame_equal(batch_estimator.df, single_estimator.df)
+        pd.testing.assert_series_equal(batch_estimator._run_linear_regression().params,
+                                       single_estimator._run_linear_regression().params)
+
+    def test_adjustment_set_modified_after_construction(self):
+        """ Test whether changes to the adjustment set after the estimator is created are used by the model. """
+        df = self.chapter_11_df.copy()
+        df['treatments_b'] = df['treatments'] % 7
+        linear_regression_estimator = LinearRegressionEstimator(('treatments',), 100, 90, set(), ('outcomes',), df)
+        linear_regression_estimator.adjustment_set.add('treatments_b')
+        model = linear_regression_estimator._run_linear_regression()
+        self.assertEqual(list(model.params.index), ['treatments', 'treatments_b', 'Intercept'])
+
+    def test_incomplete_rows_dropped(self):
+        """ Test whether rows missing a value for any necessary column are left out of the model. """
+        df = self.chapter_11_df.copy()
+        df.loc[[2, 5], 'outcomes'] = np.nan
+        df.loc[[9], 'treatments'] = np.nan
+        incomplete_estimator = LinearRegressionEstimator(('treatments',), 100, 90, set(), ('outcomes',), df)
+        complete_estimator = LinearRegressionEstimator(('treatments',), 100, 90, set(), ('outcomes',), df.dropna())
+        pd.testing.assert_series_equal(incomplete_estimator._run_linear_regression().params,
+                                       complete_estimator._run_linear_regression().params)
+
+    def test_single_precision(self):
+        """ Test whether fitting in single precision gives the same model as double precision to within tolerance. """
+        df = self.chapter_11_df.copy()
+        double_estimator = LinearRegressionEstimator(('treatments',), 100, 90, set(), ('outcomes',), df)
+        single_estimator = LinearRegressionEstimator(('treatments',), 100, 90, set(), ('outcomes',), df,
+                                                     dtype='float32')
+        self.assertEqual(len(single_estimator.modelling_assumptions), 1)
+        double_ate, double_cis = double_estimator.estimate_ate()
+        single_ate, single_cis = single_estimator.estimate_ate()
+        np.testing.assert_allclose(single_ate, double_ate, rtol=1e-4)
+        np.testing.assert_allclose(single_cis, double_cis, rtol=1e-4)
+        single_unit_ate, _ = single_estimator.estimate_unit_ate()
+        self.assertEqual(type(single_unit_ate), type(double_estimator.estimate_unit_ate()[0]))
+
+    def test_invalid_precision(self):
+        """ Test whether fitting in a non-floating point type is rejected. """
+        with self.assertRaises(ValueError):
+            LinearRegressionEstimator(('treatments',), 100, 90, set(), ('outcomes',), self.chapter_11_df,
+                                      dtype='int32')
+
 
 class TestCausalForestEstimator(unittest.TestCase):
     """ Test the linear regression estimator against the programming exercises in Section 2 of Hernán and Robins [1].
@@ -166,3 +223,16 @@ class TestCausalForestEstimator(unittest.TestCase):
                                               {'smokeintensity'})
         cates_df = causal_forest.estimate_cates()
         self.assertGreater(cates_df['cate'].mean(), 0)
+        self.assertTrue(cates_df['smokeintensity'].is_monotonic_increasing)
+
+    def test_fitted_model_reused(self):
+        """ Test whether the causal forest is fit once and reused until the data changes or the cache is cleared. """
+        df = self.nhefs_df
+        covariates = {'sex', 'race', 'age', 'wt71', 'smokeintensity', 'smokeyrs'}
+        causal_forest = CausalForestEstimator(('qsmk',), 1, 0, covariates, ('wt82_71',), df, {'smokeintensity'})
+        model, _ = causal_forest._fit_model()
+        self.assertIs(causal_forest._fit_model()[0], model)
+        causal_forest.clear_cache()
+        self.assertIsNot(causal_forest._fit_model()[0], model)
+        causal_forest.df = df.copy()
+        self.assertIsNot(causal_forest._fit_model()[0], model)